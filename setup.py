@@ -1,4 +1,3 @@
-import cx_Freeze
 import os
 import subprocess
 from pathlib import Path
@@ -26,6 +25,8 @@ def build_resources():
 
 
 def build_exe():
+    import cx_Freeze
+
     sys.argv = sys.argv[:1] + ['build']
 
     icon_path = os.path.join("icons", 'coat-of-arms.ico')
@@ -0,0 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+import monitorcontrol
+
+T = TypeVar('T')
+
+
+def run_on_monitors(monitors: list[monitorcontrol.Monitor],
+                    action: Callable[[monitorcontrol.Monitor], T]) -> list[T | Exception]:
+    # DDC/CI exchanges are serialized per monitor but independent across monitors, so they can overlap.
+    # Each monitor's result or exception is returned in order; logging is left to the caller as Qt handlers
+    # are not thread-safe.
+    with ThreadPoolExecutor(max_workers=max(len(monitors), 1)) as executor:
+        futures = [executor.submit(action, monitor) for monitor in monitors]
+
+    results: list[T | Exception] = []
+    for future in futures:
+        exception = future.exception()
+        results.append(exception if isinstance(exception, Exception) else future.result())
+    return results
@@ -9,6 +9,7 @@ from ..base.user_settings import UserSettings
 
 import requests
 import os
+import shutil
 import subprocess
 import tempfile
 import logging
@@ -16,12 +17,16 @@ import logging
 
 class UpdateChecker(BasePlugin):
 
+    INSTALLER_DIR_PREFIX = APP_INFO.APP_NAME.replace(' ', '') + '-update-'
+
     def __init__(self, parent: QWidget) -> None:
         super().__init__(parent)
 
         self.user_settings = UserSettings.instance()
         self.parent_widget = parent
 
+        self.remove_stale_installers()
+
         self.timer = QTimer()
         self.timer.timeout.connect(self.check_updates)
         self.timer.start(1000 * 30 * 60)
@@ -101,12 +106,28 @@ class UpdateChecker(BasePlugin):
         self.user_settings.set('update_last_remember_selection', int(value))
 
     def update_application(self, url):
-        temp_dir = tempfile.TemporaryDirectory()
+        # The installer outlives this call and the application, so its directory is intentionally left behind
+        # and only removed by remove_stale_installers on the next startup
+        temp_dir = tempfile.mkdtemp(prefix=self.INSTALLER_DIR_PREFIX)
         installer_file = self.download_file(url, temp_dir)
         self.run_installer(installer_file)
 
-    def download_file(self, url: str, destination: tempfile.TemporaryDirectory) -> Optional[str]:
-        temp_file_path = os.path.join(destination.name, os.path.basename(url))
+    def remove_stale_installers(self) -> None:
+        temp_root = tempfile.gettempdir()
+        for entry in os.listdir(temp_root):
+            if not entry.startswith(self.INSTALLER_DIR_PREFIX):
+                continue
+
+            # The installer may still be running right after an update, in which case the next startup retries
+            stale_dir = os.path.join(temp_root, entry)
+            shutil.rmtree(stale_dir, ignore_errors=True)
+            if os.path.exists(stale_dir):
+                logging.warn(f'Failed to remove stale installer directory: {stale_dir}')
+            else:
+                logging.info(f'Removed stale installer directory: {stale_dir}')
+
+    def download_file(self, url: str, destination: str) -> Optional[str]:
+        temp_file_path = os.path.join(destination, os.path.basename(url))
         with requests.get(url, stream=True) as r:
             r.raise_for_status()
             with open(temp_file_path, 'wb') as f:
@@ -3,9 +3,10 @@ import time
 
 from PySide6.QtGui import QAction, QActionGroup
 from PySide6.QtWidgets import QMenu, QWidget
-from PySide6.QtCore import Slot
+from PySide6.QtCore import Signal, Slot
 
 from ..base.user_settings import UserSettings
+from ..base.monitors import run_on_monitors
 from .device_listener import DeviceListener
 from .base_plugin import BasePlugin
 
@@ -15,6 +16,8 @@ import logging
 
 class DeviceDisplayMapperPlugin(BasePlugin):
 
+    input_source_changed = Signal()
+
     def __init__(self, parent: QWidget, device_listener: DeviceListener) -> None:
         super().__init__(parent)
 
@@ -67,16 +70,18 @@ class DeviceDisplayMapperPlugin(BasePlugin):
             return
 
         self.last_process = time.time()
-        for i, monitor in enumerate(monitorcontrol.get_monitors()):
+        input_source = self.user_settings.get('input_on_connect' if connected else 'input_on_disconnect')
+
+        def set_input_source(monitor):
             with monitor:
-                if connected:
-                    input_source = self.user_settings.get('input_on_connect')
-                    monitor.set_input_source(input_source)  # type: ignore
-                    logging.info(f"Changing monitor {i} input source to {input_source}")
-                else:
-                    input_source = self.user_settings.get('input_on_disconnect')
-                    monitor.set_input_source(input_source)  # type: ignore
-                    logging.info(f"Changing monitor {i} input source to {input_source}")
+                monitor.set_input_source(input_source)  # type: ignore
+
+        for i, result in enumerate(run_on_monitors(monitorcontrol.get_monitors(), set_input_source)):
+            if isinstance(result, Exception):
+                logging.warn(f"Exception was caught while changing monitor {i} input source to {input_source}: {result}")
+            else:
+                logging.info(f"Changing monitor {i} input source to {input_source}")
+        self.input_source_changed.emit()
 
     def closeEvent(self, event):
         self.device_listener.close()
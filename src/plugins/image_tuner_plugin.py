@@ -1,12 +1,16 @@
 from functools import partial
+import time
+
 from PySide6.QtWidgets import QWidget
 from PySide6.QtGui import QAction, QActionGroup
 from PySide6.QtWidgets import QMenu
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, Slot
 
 from ..base.user_settings import UserSettings
+from ..base.monitors import run_on_monitors
 from .base_plugin import BasePlugin
 from .sun_strenght_plugin import SunStrenghtPlugin
+from .device_display_mapper_plugin import DeviceDisplayMapperPlugin
 
 import monitorcontrol
 import logging
@@ -17,7 +21,11 @@ class ImageTunerPlugin(BasePlugin):
     brightness_changed = Signal(int)
     contrast_changed = Signal(int)
 
-    def __init__(self, parent: QWidget, sun_strenght_plugin: SunStrenghtPlugin) -> None:
+    # Seconds an applied value is trusted without reading the monitors back, about one sun strength period
+    APPLIED_VALUE_TTL = 90
+
+    def __init__(self, parent: QWidget, sun_strenght_plugin: SunStrenghtPlugin,
+                 device_display_mapper_plugin: DeviceDisplayMapperPlugin) -> None:
         super().__init__(parent)
 
         self.user_settings = UserSettings.instance()
@@ -33,6 +41,10 @@ class ImageTunerPlugin(BasePlugin):
 
         self.automatic_brightness_slot = None
         self.automatic_contrast_slot = None
+        self.last_applied = {}
+
+        # Switching inputs hands the monitors to another host, nothing applied before can be trusted
+        device_display_mapper_plugin.input_source_changed.connect(self.forget_applied_values)
 
         self.brightness_changed.connect(self.change_monitor_brightness)
         self.contrast_changed.connect(self.change_monitor_contrast)
@@ -49,26 +61,63 @@ class ImageTunerPlugin(BasePlugin):
                                            self.change_contrast_automatic)]
 
     def change_monitor_brightness(self, brightness):
-        # Change respective settings on the monitor through DDC/CI
-        try:
-            for i, monitor in enumerate(monitorcontrol.get_monitors()):
-                with monitor:
-                    if monitor.get_luminance() != brightness:
-                        monitor.set_luminance(brightness)
-                        logging.info(f"Setting brightness to {brightness} on monitor {i}")
-        except (ValueError, monitorcontrol.VCPError) as e:
-            logging.warn(f"Exception was caught while changing brightness: {e}")
+        self.apply_to_monitors('brightness', brightness,
+                               monitorcontrol.Monitor.get_luminance,
+                               monitorcontrol.Monitor.set_luminance)
 
     def change_monitor_contrast(self, contrast):
-        # Change respective settings on the monitor through DDC/CI
+        self.apply_to_monitors('contrast', contrast,
+                               monitorcontrol.Monitor.get_contrast,
+                               monitorcontrol.Monitor.set_contrast)
+
+    def apply_to_monitors(self, key, value, getter, setter):
         try:
-            for i, monitor in enumerate(monitorcontrol.get_monitors()):
-                with monitor:
-                    if monitor.get_contrast() != contrast:
-                        monitor.set_contrast(contrast)
-                        logging.info(f"Setting contrast to {contrast} on monitor {i}")
+            monitors = monitorcontrol.get_monitors()
         except (ValueError, monitorcontrol.VCPError) as e:
-            logging.warn(f"Exception was caught while changing contrast: {e}")
+            self.last_applied.pop(key, None)
+            logging.warn(f"Exception was caught while changing {key}: {e}")
+            return
+
+        last_value = self.trusted_last_applied(key, len(monitors))
+        if last_value == value:
+            return
+
+        # The monitors are trusted to still hold a different value, so skip the read whose only purpose is
+        # avoiding a harmless redundant write
+        known_different = last_value is not None
+
+        def apply(monitor):
+            # Change respective settings on the monitor through DDC/CI
+            with monitor:
+                if known_different or getter(monitor) != value:
+                    setter(monitor, value)
+                    return True
+            return False
+
+        failed = False
+        for i, result in enumerate(run_on_monitors(monitors, apply)):
+            if isinstance(result, Exception):
+                failed = True
+                logging.warn(f"Exception was caught while changing {key} on monitor {i}: {result}")
+            elif result:
+                logging.info(f"Setting {key} to {value} on monitor {i}")
+
+        if failed:
+            self.last_applied.pop(key, None)
+        else:
+            self.last_applied[key] = (value, len(monitors), time.time())
+
+    def trusted_last_applied(self, key, monitor_count):
+        # Monitors can also be changed through their own buttons or by the other host, so the last applied value
+        # is only trusted briefly and while the same monitors are attached
+        last_value, last_monitor_count, last_time = self.last_applied.get(key, (None, 0, 0))
+        if last_monitor_count != monitor_count or time.time() - last_time >= self.APPLIED_VALUE_TTL:
+            return None
+        return last_value
+
+    @Slot()
+    def forget_applied_values(self):
+        self.last_applied.clear()
 
     def create_value_control_menu(self, title, property_get, manual_slot, automatic_slot) -> QMenu:
         menu = QMenu(title, self)
@@ -13,6 +13,10 @@ class SunStrenghtPlugin(BasePlugin):
 
     sun_strength_changed = Signal(int)
 
+    TIMEZONE = pytz.timezone('Europe/Zurich')
+    LATITUDE = 46.521410
+    LONGITUDE = 6.632273
+
     def __init__(self, parent: QWidget) -> None:
         super().__init__(parent)
         self.timer = QTimer()
@@ -21,8 +25,8 @@ class SunStrenghtPlugin(BasePlugin):
 
     def calculate_sun_strenght(self):
         # Apply functions based on the location and sun strenght
-        request = datetime.now().astimezone(pytz.timezone('Europe/Zurich'))
-        altitude = solar.get_altitude(46.521410, 6.632273, request) + 5
+        request = datetime.now().astimezone(self.TIMEZONE)
+        altitude = solar.get_altitude(self.LATITUDE, self.LONGITUDE, request) + 5
         power = radiation.get_radiation_direct(request, altitude)
 
         current_value = int(power / 6.0) if power < 600 else int(100)
@@ -32,9 +32,9 @@ class SwissWindowsKnife:
 
                 frame = frame.f_back
                 while frame is not None:
-                    module = inspect.getmodule(frame)
-                    if module and module != logging:
-                        record.name = module.__name__
+                    module_name = frame.f_globals.get('__name__')
+                    if module_name and module_name != logging.__name__:
+                        record.name = module_name
                         break
                     frame = frame.f_back
                 return True
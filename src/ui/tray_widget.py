@@ -28,9 +28,10 @@ class TrayWidget(QWidget):
         self.logger_window = TrayLogger(self)
         self.logger_window.hide()
 
+        device_display_mapper_plugin = DeviceDisplayMapperPlugin(self, DeviceListener(self))
         self.plugins: list[BasePlugin] = [
-            ImageTunerPlugin(self, SunStrenghtPlugin(self)),
-            DeviceDisplayMapperPlugin(self, DeviceListener(self)),
+            ImageTunerPlugin(self, SunStrenghtPlugin(self), device_display_mapper_plugin),
+            device_display_mapper_plugin,
             UpdateChecker(self)
         ]
 